@@ -269,7 +269,7 @@ class CitiBikePipeline(DataPipeline):
 
     def _process_distance(self, station_info: pd.DataFrame):
         distance_adj = pd.DataFrame(0, index=station_info["station_index"],
-                                    columns=station_info["station_index"], dtype=np.float)
+                                    columns=station_info["station_index"], dtype=np.float64)
         look_up_df = station_info[["latitude", "longitude"]]
         return distance_adj.apply(lambda x: pd.DataFrame(x).apply(lambda y: geopy.distance.distance(
             (look_up_df.at[x.name, "latitude"], look_up_df.at[x.name, "longitude"]),
@@ -540,7 +540,7 @@ class CitiBikeToyPipeline(DataPipeline):
             0,
             index=station_init["station_index"],
             columns=station_init["station_index"],
-            dtype=np.float
+            dtype=np.float64
         )
         look_up_df = station_init[["latitude", "longitude"]]
         distance_df = distance_adj.apply(lambda x: pd.DataFrame(x).apply(lambda y: geopy.distance.distance(
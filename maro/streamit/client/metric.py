@@ -60,7 +60,6 @@ def is_float_type(v_type: type):
         bool: True if an float type.
     """
     return v_type is float      \
-        or v_type is np.float   \
         or v_type is np.float32 \
         or v_type is np.float64
 